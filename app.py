@@ -1,37 +1,102 @@
-from flask import Flask, request
+import asyncio
+import os
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from quart import Quart, request
 from response_handler import ResponseHandler
 from resume_parser_service import ResumeParserService
 
-app = Flask(__name__)
+app = Quart(__name__)
+
+# CPU-bound PDF parsing runs in worker processes to escape the GIL
+PARSER_WORKERS = int(os.environ.get("PARSER_WORKERS", os.cpu_count() or 1))
+_pool = None
+
+@app.before_serving
+async def start_parser_pool():
+    global _pool
+    _pool = ProcessPoolExecutor(max_workers=PARSER_WORKERS)
+
+@app.after_serving
+async def close_resources():
+    await ResumeParserService.close_session()
+    if _pool is not None:
+        _pool.shutdown(wait=False)
+
+def _restart_parser_pool(broken_pool):
+    """Replace a pool whose worker died (e.g. MuPDF crash or OOM kill)."""
+    global _pool
+    # Several requests can see the same broken pool; only the first replaces it
+    if _pool is broken_pool:
+        broken_pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=PARSER_WORKERS)
+
+async def _with_parser_pool(call):
+    """
+    Await call(pool) against the parser pool. If a worker process died, the
+    shared pool is rebuilt and the call is retried once in a throwaway
+    single-worker pool, so an input that always crashes cannot break the
+    replacement pool (and every request running on it) a second time.
+    """
+    pool = _pool
+    try:
+        return await call(pool)
+    except BrokenExecutor:
+        _restart_parser_pool(pool)
+    isolated = ProcessPoolExecutor(max_workers=1)
+    try:
+        return await call(isolated)
+    finally:
+        isolated.shutdown(wait=False)
+
+async def _run_blocking(func, *args):
+    """Run CPU-bound parsing in the process pool so the event loop stays responsive."""
+    loop = asyncio.get_running_loop()
+    return await _with_parser_pool(lambda pool: loop.run_in_executor(pool, func, *args))
 
 @app.route('/api/parse_resume', methods=['POST'])
-def parse_resume():
-    data = request.get_json()
+async def parse_resume():
+    data = await request.get_json()
     if not data or 'file_url' not in data:
         return ResponseHandler.validation_error("Missing 'file_url' in request body")
     file_url = data['file_url']
     try:
-        file_bytes = ResumeParserService.download_file(file_url)
-        extracted_info = ResumeParserService.extract_resume_info(file_bytes)
+        file_bytes = await ResumeParserService.download_file(file_url)
+        try:
+            text = await _with_parser_pool(lambda pool: ResumeParserService.extract_all_text_async(file_bytes, pool))
+        except Exception as e:
+            raise Exception(f"Could not extract text from PDF: {str(e)}")
+        extracted_info = await _run_blocking(ResumeParserService.extract_resume_info_text, text)
         return ResponseHandler.success(extracted_info, message="Resume parsed successfully.")
     except Exception as e:
         return ResponseHandler.server_error(str(e))
 
 @app.route('/api/is_readable', methods=['POST'])
-def is_readable():
-    data = request.get_json()
+async def is_readable():
+    data = await request.get_json()
     if not data or 'file_url' not in data:
         return ResponseHandler.validation_error("Missing 'file_url' in request body")
     file_url = data['file_url']
     try:
-        file_bytes = ResumeParserService.download_file(file_url)
-        is_valid = ResumeParserService.validate_pdf(file_bytes)
+        file_bytes = await ResumeParserService.download_file(file_url)
+        try:
+            text = await _with_parser_pool(lambda pool: ResumeParserService.extract_all_text_async(file_bytes, pool))
+        except BrokenExecutor:
+            raise
+        except RuntimeError:
+            # PyMuPDF could not parse the file (FileDataError and MuPDF page errors)
+            text = ""
+        is_valid = ResumeParserService.validate_text(text)
         if not is_valid:
             return ResponseHandler.validation_error(f"PDF is not readable (might be scanned image or contains less than {ResumeParserService.MIN_WORDS_THRESHOLD} words)", {"is_readable": False, "ats_compliant": False, "fields": {}})
-        ats_result = ResumeParserService.check_ats_compliance(file_bytes)
+        ats_result = await _with_parser_pool(lambda pool: ResumeParserService.check_ats_compliance_text_async(text, pool))
         return ResponseHandler.success({"is_readable": is_valid, **ats_result}, message="PDF readability and ATS compliance check completed.")
     except Exception as e:
         return ResponseHandler.server_error(str(e))
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5002) 
\ No newline at end of file
+    if os.environ.get("DEBUG"):
+        # Quart's development server (auto-reload, debugger)
+        app.run(host='0.0.0.0', port=5002, debug=True)
+    else:
+        import uvicorn
+        uvicorn.run("app:app", host='0.0.0.0', port=5002, workers=int(os.environ.get("WEB_CONCURRENCY", 2)))
\ No newline at end of file
@@ -0,0 +1,12 @@
+import os
+
+# Production server: gunicorn managing uvicorn (ASGI) workers.
+#   gunicorn app:app
+# Each worker runs its own event loop and its own PDF parsing process pool,
+# so a small number of workers is enough to keep every CPU busy.
+bind = os.environ.get("BIND", "0.0.0.0:5002")
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
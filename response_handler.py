@@ -1,4 +1,4 @@
-from flask import jsonify
+from quart import jsonify
 from typing import Any, Optional
 
 class ResponseHandler:
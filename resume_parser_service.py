@@ -1,155 +1,464 @@
-import requests
-from PyPDF2 import PdfReader
-import io
+import aiohttp
+import asyncio
+import pymupdf
+import copy
+import hashlib
 import os
-import pdfplumber
 import re
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
 from datetime import datetime
 
+_WORD_RE = re.compile(r"\S+")
+
+# Fields reported by the ATS compliance check, in response order
+_ATS_FIELD_NAMES = (
+    "full_name", "email", "phone", "education", "work_experience",
+    "skills", "location", "interests", "volunteer"
+)
+
+# Patterns used by the ATS compliance check, compiled once at import time
+_EDU_KEYWORDS = (
+    "university", "college", "bachelor", "master", "phd", "degree",
+    "education", "gpa", "graduation", "diploma", "faculty", "school"
+)
+_WORK_KEYWORDS = (
+    "company", "position", "experience", "employment", "work history",
+    "professional experience"
+)
+# Line-anchored patterns run once over the whole text with re.MULTILINE;
+# [^\S\n] is whitespace that never crosses a line break
+_ATS_NAME_RE = re.compile(r"^[^\S\n]*#[^\S\n]+[A-Z][a-z]+([^\S\n]+[A-Z][a-z]+)+", re.MULTILINE)
+_ATS_EMAIL_RE = re.compile(r"\b[a-zA-Z0-9_.+-]{1,64}@[a-zA-Z0-9-]{1,63}\.[a-zA-Z0-9-.]{1,190}\b")
+_ATS_PHONE_RE = re.compile(r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b")
+_EDU_HEADER_RE = re.compile(r"^[^\S\n]*#+[^\S\n]*EDUCATION[^\S\n]*$", re.IGNORECASE | re.MULTILINE)
+_WORK_HEADER_RE = re.compile(r"^[^\S\n]*#+[^\S\n]*WORK[^\S\n]+EXPERIENCE[^\S\n]*$", re.IGNORECASE | re.MULTILINE)
+# Keyword alternations, matched against lowercased text
+_EDU_KEYWORDS_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _EDU_KEYWORDS)) + r")\b")
+_WORK_KEYWORDS_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _WORK_KEYWORDS)) + r")\b")
+_ADDITIONAL_INFO_HEADER_RE = re.compile(r"^[^\S\n]*#+[^\S\n]*ADDITIONAL[^\S\n]+INFORMATION[^\S\n]*$", re.IGNORECASE | re.MULTILINE)
+_SKILLS_LINE_RE = re.compile(r"Skills:[^\S\n]*.+", re.IGNORECASE)
+_SKILLS_WORD_RE = re.compile(r"skills", re.IGNORECASE)
+
+def _nth_line_end(text: str, start: int, n: int) -> int:
+    """Return the offset where the n-th line starting at `start` ends."""
+    end = start - 1
+    for _ in range(n):
+        end = text.find('\n', end + 1)
+        if end == -1:
+            return len(text)
+    return end
+
+# ATS field checks; each takes the text and its lowercased copy
+def _ats_has_full_name(text: str, text_lower: str) -> bool:
+    return bool(_ATS_NAME_RE.search(text))
+
+def _ats_has_email(text: str, text_lower: str) -> bool:
+    return bool(_ATS_EMAIL_RE.search(text))
+
+def _ats_has_phone(text: str, text_lower: str) -> bool:
+    return bool(_ATS_PHONE_RE.search(text))
+
+def _ats_has_education(text: str, text_lower: str) -> bool:
+    # Section header first: the keyword scan only runs when a header exists
+    return bool(_EDU_HEADER_RE.search(text) and _EDU_KEYWORDS_RE.search(text_lower))
+
+def _ats_has_work_experience(text: str, text_lower: str) -> bool:
+    return bool(_WORK_HEADER_RE.search(text) and _WORK_KEYWORDS_RE.search(text_lower))
+
+def _ats_has_skills(text: str, text_lower: str) -> bool:
+    if _SKILLS_LINE_RE.search(text):
+        return True
+    # "skills" within the 5 lines that start at an ADDITIONAL INFORMATION header
+    return any(
+        _SKILLS_WORD_RE.search(text, header.start(), _nth_line_end(text, header.start(), 5))
+        for header in _ADDITIONAL_INFO_HEADER_RE.finditer(text)
+    )
+
+# Cheapest checks first, so fail_fast stops before the costlier scans
+_ATS_CHECKS = (
+    ("full_name", _ats_has_full_name),
+    ("email", _ats_has_email),
+    ("phone", _ats_has_phone),
+    ("skills", _ats_has_skills),
+    ("education", _ats_has_education),
+    ("work_experience", _ats_has_work_experience),
+)
+
+# Patterns used by resume info extraction
+# Quantifiers are bounded (RFC 5321 lengths, 200-char URLs) so a long token
+# without a match costs a capped amount of backtracking per start position
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Z|a-z]{2,}\b')
+# Optional country code, a 2-4 digit area/operator code, then 3 + 3-4 digits,
+# e.g. 555-123-4567, (555) 123-4567, +1 555 123 4567, +963 912 345 678
+_PHONE_RE = re.compile(
+    r'(?<!\d)(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)[\s.-]?|\d{2,4}[\s.-]?)\d{3}[\s.-]?\d{3,4}(?!\d)'
+)
+# A line holding only two or more capitalized words; [^\S\n] keeps it on one line
+_NAME_RE = re.compile(r'^[^\S\n]*([A-Z][a-z]+(?:[^\S\n]+[A-Z][a-z]+)+)[^\S\n]*$', re.MULTILINE)
+_GITHUB_RE = re.compile(r'github\.com/[^\s]+', re.IGNORECASE)
+_LINKEDIN_RE = re.compile(r'linkedin\.com/[^\s]+', re.IGNORECASE)
+_PORTFOLIO_RE = re.compile(r'https?://\S{0,200}(?:portfolio|website|site)\S{0,200}', re.IGNORECASE)
+_CONTACT_SPLIT_RE = re.compile(r'[|,\s]+')
+_SKILL_SPLIT_RE = re.compile(r'[,\s]+')
+_EXPERIENCE_DATE_RE = re.compile(r'\d{2}/\d{4}|\d{4}')
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Section headers used to split the resume; dict order is the match priority
+_SECTION_KEYWORDS = {
+    "experience": ("experience", "work experience", "employment", "professional experience"),
+    "education": ("education", "academic", "qualifications"),
+    "skills": ("skills", "technical skills", "competencies", "technologies"),
+    "interests": ("interests", "hobbies", "activities"),
+    "volunteer": ("volunteer", "volunteering", "community service"),
+    "additional_info": ("additional information", "additional info", "other information")
+}
+# Every header keyword (all are three words or fewer) for O(1) whole-line lookups
+_ALL_SECTION_HEADERS = frozenset(
+    keyword for keywords in _SECTION_KEYWORDS.values() for keyword in keywords
+)
+# Plain alternation of every header keyword: one search() rejects the
+# keyword-free majority of lines before the per-section lookup runs
+_SECTION_KEYWORDS_RE = re.compile("|".join(map(re.escape, _ALL_SECTION_HEADERS)))
+
+# Words in a contact line that are links rather than part of the location
+_URL_RE = re.compile(r"https?://|www\.|github\.com|linkedin\.com", re.IGNORECASE)
+# Email, phone and link prefixes in one alternation, so each contact-line word
+# needs a single match() call (the email/phone patterns are case-insensitive already)
+_CONTACT_TOKEN_RE = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in (_EMAIL_RE, _PHONE_RE, _URL_RE)),
+    re.IGNORECASE
+)
+
 class ResumeParserService:
     MIN_WORDS_THRESHOLD = 50
-    
+    CACHE_MAX_ENTRIES = 256
+    ATS_CACHE_MAX_ENTRIES = 512
+    DOWNLOAD_CACHE_TTL = 300  # seconds
+    DOWNLOAD_CACHE_MAX_ENTRIES = 16
+    DOWNLOAD_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    MAX_PDF_BYTES = int(os.environ.get("MAX_PDF_BYTES", 10 * 1024 * 1024))
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    DOWNLOAD_RETRIES = 2
+    DOWNLOAD_RETRY_BACKOFF = 0.2  # seconds, doubled after every failed attempt
+
+    # LRU cache of extracted text keyed by the blake2b fingerprint of the file bytes
+    _text_cache = OrderedDict()
+    # LRU cache of ATS results keyed by the fingerprint of the extracted text, so
+    # different files that yield the same text share one entry
+    _ats_cache = OrderedDict()
+    # Remote downloads keyed by URL, values are (downloaded_at, bytes); bounded by
+    # entry count and by the total size of the cached bodies
+    _download_cache = OrderedDict()
+    _download_cache_bytes = 0
+    _cache_lock = threading.Lock()
+    # Shared HTTP session so connections (and TLS handshakes) are reused across requests
+    _session = None
+
+    @staticmethod
+    def _fingerprint(file_bytes: bytes) -> bytes:
+        """Return a short content hash used as the cache key for a file."""
+        return hashlib.blake2b(file_bytes, digest_size=16).digest()
+
+    @staticmethod
+    def _text_fingerprint(text: str) -> bytes:
+        """Return a short content hash of extracted text."""
+        return hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=16).digest()
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key):
+        """Return the cached value for key (or None) and mark it as recently used."""
+        with ResumeParserService._cache_lock:
+            if key not in cache:
+                return None
+            cache.move_to_end(key)
+            return cache[key]
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, max_entries: int = None) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        if max_entries is None:
+            max_entries = ResumeParserService.CACHE_MAX_ENTRIES
+        with ResumeParserService._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > max_entries:
+                cache.popitem(last=False)
+
+    @staticmethod
+    def _download_cache_get(url: str):
+        """Return the cached body for url if it is still fresh, dropping it otherwise."""
+        cache = ResumeParserService._download_cache
+        with ResumeParserService._cache_lock:
+            entry = cache.get(url)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= ResumeParserService.DOWNLOAD_CACHE_TTL:
+                del cache[url]
+                ResumeParserService._download_cache_bytes -= len(entry[1])
+                return None
+            cache.move_to_end(url)
+            return entry[1]
+
+    @staticmethod
+    def _download_cache_put(url: str, content: bytes) -> None:
+        """Cache a downloaded body, purging expired entries and evicting LRU ones over budget."""
+        if len(content) > ResumeParserService.DOWNLOAD_CACHE_MAX_BYTES:
+            return
+        cache = ResumeParserService._download_cache
+        now = time.monotonic()
+        with ResumeParserService._cache_lock:
+            old = cache.pop(url, None)
+            if old is not None:
+                ResumeParserService._download_cache_bytes -= len(old[1])
+            for key, (downloaded_at, body) in list(cache.items()):
+                if now - downloaded_at >= ResumeParserService.DOWNLOAD_CACHE_TTL:
+                    del cache[key]
+                    ResumeParserService._download_cache_bytes -= len(body)
+            cache[url] = (now, content)
+            ResumeParserService._download_cache_bytes += len(content)
+            while (len(cache) > ResumeParserService.DOWNLOAD_CACHE_MAX_ENTRIES
+                   or ResumeParserService._download_cache_bytes > ResumeParserService.DOWNLOAD_CACHE_MAX_BYTES):
+                _, (_, body) = cache.popitem(last=False)
+                ResumeParserService._download_cache_bytes -= len(body)
+
     @staticmethod
-    def download_file(file_url: str) -> bytes:
+    def _get_session() -> aiohttp.ClientSession:
+        """Return the shared keep-alive HTTP session, creating it on first use."""
+        session = ResumeParserService._session
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=32)
+            timeout = aiohttp.ClientTimeout(sock_connect=5, sock_read=30)
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            ResumeParserService._session = session
+        return session
+
+    @staticmethod
+    async def close_session() -> None:
+        """Close the shared HTTP session (called when the app shuts down)."""
+        session = ResumeParserService._session
+        ResumeParserService._session = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    @staticmethod
+    def _assert_pdf(head: bytes) -> None:
+        """Raise if the leading bytes are not the PDF signature."""
+        if not head.startswith(b"%PDF-"):
+            raise Exception("The file is not a PDF.")
+
+    @staticmethod
+    async def _fetch_pdf(file_url: str) -> bytes:
+        """Stream a remote PDF, rejecting bad responses before reading the whole body."""
+        session = ResumeParserService._get_session()
+        async with session.get(file_url) as response:
+            # Reject bad responses from the headers alone, before reading the body
+            if response.status != 200:
+                response.close()
+                raise Exception(f"Failed to download file. Status code: {response.status}")
+            if (response.content_length or 0) > ResumeParserService.MAX_PDF_BYTES:
+                response.close()
+                raise Exception(f"The file exceeds the maximum size of {ResumeParserService.MAX_PDF_BYTES} bytes.")
+            # Content-Type is unreliable (often application/octet-stream), so the
+            # PDF signature decides, at the cost of 5 bytes on a mismatch
+            try:
+                head = await response.content.readexactly(5)
+            except asyncio.IncompleteReadError:
+                head = b""
+            try:
+                ResumeParserService._assert_pdf(head)
+            except Exception:
+                response.close()
+                raise
+            buffer = bytearray(head)
+            async for chunk in response.content.iter_chunked(ResumeParserService.DOWNLOAD_CHUNK_SIZE):
+                buffer.extend(chunk)
+                if len(buffer) > ResumeParserService.MAX_PDF_BYTES:
+                    response.close()
+                    raise Exception(f"The file exceeds the maximum size of {ResumeParserService.MAX_PDF_BYTES} bytes.")
+            return bytes(buffer)
+
+    @staticmethod
+    async def download_file(file_url: str) -> bytes:
         """
         Download the file from the given URL or read from local path and return its content as bytes.
         """
         if file_url.startswith('http://') or file_url.startswith('https://'):
-            response = requests.get(file_url)
-            if response.status_code != 200:
-                raise Exception(f"Failed to download file. Status code: {response.status_code}")
-            content_type = response.headers.get('Content-Type', '')
-            if 'pdf' not in content_type:
-                raise Exception("The file is not a PDF.")
-            return response.content
+            cached = ResumeParserService._download_cache_get(file_url)
+            if cached is not None:
+                return cached
+            # Retry only transient connection failures, never a rejected file
+            for attempt in range(ResumeParserService.DOWNLOAD_RETRIES + 1):
+                try:
+                    content = await ResumeParserService._fetch_pdf(file_url)
+                    break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == ResumeParserService.DOWNLOAD_RETRIES:
+                        raise
+                    await asyncio.sleep(ResumeParserService.DOWNLOAD_RETRY_BACKOFF * 2 ** attempt)
+            ResumeParserService._download_cache_put(file_url, content)
+            return content
         else:
             # Assume local file path
             if not os.path.isfile(file_url):
                 raise Exception(f"Local file not found: {file_url}")
             if not file_url.lower().endswith('.pdf'):
                 raise Exception("The file is not a PDF.")
-            with open(file_url, 'rb') as f:
-                return f.read()
+            # Read in a single syscall off the event loop; the bytes are shared
+            # by every downstream step (and sent as-is to the parser pool)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, ResumeParserService._read_local_file, file_url)
+
+    @staticmethod
+    def _read_local_file(path: str) -> bytes:
+        """Read a local PDF into memory with a single read of its known size."""
+        with open(path, 'rb', buffering=0) as f:
+            ResumeParserService._assert_pdf(f.read(5))
+            f.seek(0)
+            return f.readall()
+
+    @staticmethod
+    def extract_all_text(file_bytes: bytes) -> str:
+        """
+        Open the PDF a single time and return the plain text of every page.
+        Callers should reuse the returned text instead of re-parsing the file.
+        Results are cached by file hash, so repeated files skip parsing.
+        """
+        key = ResumeParserService._fingerprint(file_bytes)
+        text = ResumeParserService._cache_get(ResumeParserService._text_cache, key)
+        if text is not None:
+            return text
+        text = ResumeParserService._read_pdf_text(file_bytes)
+        ResumeParserService._cache_put(ResumeParserService._text_cache, key, text)
+        return text
+
+    @staticmethod
+    async def extract_all_text_async(file_bytes: bytes, executor=None) -> str:
+        """
+        Same as extract_all_text, but parses the PDF in the given executor
+        (e.g. a process pool). The cache is checked and filled in the caller's
+        process so hits never leave it.
+        """
+        key = ResumeParserService._fingerprint(file_bytes)
+        text = ResumeParserService._cache_get(ResumeParserService._text_cache, key)
+        if text is not None:
+            return text
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(executor, ResumeParserService._read_pdf_text, file_bytes)
+        ResumeParserService._cache_put(ResumeParserService._text_cache, key, text)
+        return text
+
+    @staticmethod
+    def _read_pdf_text(file_bytes: bytes) -> str:
+        """Parse the PDF with PyMuPDF and join the text of all pages (no caching)."""
+        doc = pymupdf.open(stream=file_bytes, filetype="pdf")
+        try:
+            return "\n".join(page.get_text("text") for page in doc)
+        finally:
+            doc.close()
+
+    @staticmethod
+    def validate_text(text: str) -> bool:
+        """
+        Return True if the extracted text has a reasonable amount of words
+        (i.e. the PDF is text-based and not a scanned image).
+        Stops counting as soon as the threshold is passed.
+        """
+        limit = ResumeParserService.MIN_WORDS_THRESHOLD + 1
+        return sum(1 for _ in islice(_WORD_RE.finditer(text), limit)) == limit
 
     @staticmethod
     def validate_pdf(file_bytes: bytes) -> bool:
         """
         Validate that the file is a readable PDF (not scanned image).
         Returns True if the PDF contains extractable text, False otherwise.
+        Goes through the shared text cache, so a following
+        check_ats_compliance/extract_resume_info call does not reopen the file.
         """
         try:
-            pdf = PdfReader(io.BytesIO(file_bytes))
-            text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text.strip()
-            # Consider it valid if there is a reasonable amount of text
-            return len(text.split()) > ResumeParserService.MIN_WORDS_THRESHOLD  # At least 100 words
+            text = ResumeParserService.extract_all_text(file_bytes)
         except Exception:
             return False
+        return ResumeParserService.validate_text(text)
 
     @staticmethod
-    def check_ats_compliance(file_bytes: bytes) -> dict:
+    def check_ats_compliance(file_bytes: bytes, fail_fast: bool = False, include_details: bool = False) -> dict:
         """
         Check if the PDF contains essential ATS fields (name, email, phone, etc.).
         Returns a dict with found/missing fields with enhanced accuracy.
         """
         try:
-            pdf = PdfReader(io.BytesIO(file_bytes))
-            text = ""
-            lines = []  # سنحتفظ بالأسطر الفردية لتحليل أفضل
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:  # تحقق من أن النص ليس None
-                    text += page_text + "\n"
-                    lines.extend(page_text.splitlines())  # حفظ كل سطر بشكل منفصل
+            text = ResumeParserService.extract_all_text(file_bytes)
         except Exception as e:
             return {"ats_compliant": False, "fields": {}, "error": f"Could not extract text from PDF: {str(e)}"}
+        return ResumeParserService.check_ats_compliance_text(text, fail_fast, include_details)
 
+    @staticmethod
+    def check_ats_compliance_text(text: str, fail_fast: bool = False, include_details: bool = False) -> dict:
+        """
+        Check already extracted resume text for essential ATS fields.
+        Results are cached by a hash of the text. The regex patterns used are
+        only added to the result (under "details") when include_details is set.
+        """
+        key = (ResumeParserService._text_fingerprint(text), fail_fast)
+        cached = ResumeParserService._cache_get(ResumeParserService._ats_cache, key)
+        if cached is not None:
+            return ResumeParserService._with_details(copy.deepcopy(cached), include_details)
+        result = ResumeParserService._evaluate_ats_fields(text, fail_fast)
+        ResumeParserService._cache_put(ResumeParserService._ats_cache, key, copy.deepcopy(result), ResumeParserService.ATS_CACHE_MAX_ENTRIES)
+        return ResumeParserService._with_details(result, include_details)
+
+    @staticmethod
+    async def check_ats_compliance_text_async(text: str, executor=None, fail_fast: bool = False, include_details: bool = False) -> dict:
+        """
+        Same as check_ats_compliance_text, but evaluates cache misses in the
+        given executor while the cache stays in the caller's process.
+        """
+        key = (ResumeParserService._text_fingerprint(text), fail_fast)
+        cached = ResumeParserService._cache_get(ResumeParserService._ats_cache, key)
+        if cached is not None:
+            return ResumeParserService._with_details(copy.deepcopy(cached), include_details)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(executor, ResumeParserService._evaluate_ats_fields, text, fail_fast)
+        ResumeParserService._cache_put(ResumeParserService._ats_cache, key, copy.deepcopy(result), ResumeParserService.ATS_CACHE_MAX_ENTRIES)
+        return ResumeParserService._with_details(result, include_details)
+
+    @staticmethod
+    def _with_details(result: dict, include_details: bool) -> dict:
+        """Attach the ATS regex patterns to a successful result when requested."""
+        if include_details and "error" not in result:
+            result["details"] = {
+                "name_pattern": _ATS_NAME_RE.pattern,
+                "email_pattern": _ATS_EMAIL_RE.pattern,
+                "phone_pattern": _ATS_PHONE_RE.pattern
+            }
+        return result
+
+    @staticmethod
+    def _evaluate_ats_fields(text: str, fail_fast: bool = False) -> dict:
+        """
+        Check the text for essential ATS fields (no caching).
+        Returns a dict with found/missing fields with enhanced accuracy.
+        With fail_fast, stops at the first missing field (later fields stay False).
+        """
         # تحقق من أن النص المستخرج ليس فارغًا
         if not text.strip():
             return {"ats_compliant": False, "fields": {}, "error": "No text content found in PDF (might be scanned image)"}
 
-        import re
-        fields = {
-            "full_name": False,
-            "email": False,
-            "phone": False,
-            "education": False,
-            "work_experience": False,
-            "skills": False,
-            "location": False,
-            "interests": False,
-            "volunteer": False
-        }
+        fields = dict.fromkeys(_ATS_FIELD_NAMES, False)
         
-        # تحسينات في اكتشاف الاسم
-        name_pattern = r"^#\s+[A-Z][a-z]+(\s+[A-Z][a-z]+)+"
-        for line in lines:
-            if re.match(name_pattern, line.strip()):
-                fields["full_name"] = True
+        text_lower = text.lower()
+        for field, check in _ATS_CHECKS:
+            fields[field] = check(text, text_lower)
+            if fail_fast and not fields[field]:
                 break
         
-        # تحسينات في اكتشاف البريد الإلكتروني والهاتف
-        email_pattern = r"\b[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+\b"
-        phone_pattern = r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"
-        
-        fields["email"] = bool(re.search(email_pattern, text))
-        fields["phone"] = bool(re.search(phone_pattern, text))
-        
-        # تحسينات في اكتشاف التعليم
-        education_keywords = [
-            "university", "college", "bachelor", "master", "phd", "degree", 
-            "education", "gpa", "graduation", "diploma", "faculty", "school"
-        ]
-        education_section_found = any(
-            re.search(r"^#+\s*EDUCATION\s*$", line.strip(), re.IGNORECASE) 
-            for line in lines
-        )
-        
-        education_content_found = any(
-            re.search(rf"\b{re.escape(keyword)}\b", text, re.IGNORECASE) 
-            for keyword in education_keywords
-        )
-        
-        fields["education"] = education_section_found and education_content_found
-        
-        # تحسينات في اكتشاف الخبرة العملية
-        work_experience_section_found = any(
-            re.search(r"^#+\s*WORK\s+EXPERIENCE\s*$", line.strip(), re.IGNORECASE) 
-            for line in lines
-        )
-        
-        work_content_found = any(
-            re.search(r"\b(company|position|experience|employment|work history|professional experience)\b", text, re.IGNORECASE)
-        )
-        
-        fields["work_experience"] = work_experience_section_found and work_content_found
-        
-        # تحسينات في اكتشاف المهارات
-        skills_section_found = any(
-            re.search(r"^#+\s*ADDITIONAL\s+INFORMATION\s*$", line.strip(), re.IGNORECASE) 
-            and any("skills" in line.lower() for line in lines[i:i+5])  # البحث في الأسطر التالية
-            for i, line in enumerate(lines)
-        )
-        
-        skills_content_found = any(
-            re.search(r"Skills:\s*.+", line, re.IGNORECASE) 
-            for line in lines
-        )
-        
-        fields["skills"] = skills_section_found or skills_content_found
-        
         ats_compliant = all(fields.values())
         return {
             "ats_compliant": ats_compliant,
-            "fields": fields,
-            "details": {
-                "name_pattern": name_pattern,
-                "email_pattern": email_pattern,
-                "phone_pattern": phone_pattern
-            }
+            "fields": fields
         }
 
     @staticmethod
@@ -158,16 +467,16 @@ class ResumeParserService:
         Extract relevant information from the PDF resume using advanced libraries.
         """
         try:
-            # Use pdfplumber for better text extraction
-            with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+            text = ResumeParserService.extract_all_text(file_bytes)
         except Exception as e:
             raise Exception(f"Could not extract text from PDF: {str(e)}")
+        return ResumeParserService.extract_resume_info_text(text)
 
+    @staticmethod
+    def extract_resume_info_text(text: str) -> dict:
+        """
+        Extract relevant information from already extracted resume text.
+        """
         if not text.strip():
             raise Exception("No text content found in PDF")
 
@@ -195,78 +504,58 @@ class ResumeParserService:
         lines = text.split('\n')
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_matches = re.findall(email_pattern, text)
-        if email_matches:
-            result["email"] = email_matches[0]
+        email_match = _EMAIL_RE.search(text)
+        if email_match:
+            result["email"] = email_match.group()
 
         # Extract phone numbers (multiple formats)
-        phone_patterns = [
-            r'\+?[\d\s\-\(\)]{10,}',  # International format
-            r'\(\d{3}\)\s*\d{3}-\d{4}',  # US format
-            r'\d{3}-\d{3}-\d{4}',  # US format with dashes
-            r'\d{10,}',  # Simple digits
-        ]
-        
-        for pattern in phone_patterns:
-            phone_matches = re.findall(pattern, text)
-            if phone_matches:
-                result["phone"] = phone_matches[0].strip()
-                break
+        phone_match = _PHONE_RE.search(text)
+        if phone_match:
+            result["phone"] = phone_match.group()
 
         # Extract name (first prominent name-like line)
-        name_pattern = r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$'
-        for line in lines[:5]:  # Check first 5 lines
-            line_clean = line.strip()
-            if re.match(name_pattern, line_clean) and len(line_clean.split()) >= 2:
-                result["full_name"] = line_clean
-                break
+        name_match = _NAME_RE.search(text, 0, _nth_line_end(text, 0, 5))  # Check first 5 lines
+        if name_match:
+            result["full_name"] = name_match.group(1)
 
-        # Extract location from contact line
+        # Extract location from contact line: the line holding the earliest
+        # email/phone match in the whole text, instead of regex-scanning every line
         contact_line = ""
-        for line in lines:
-            if (re.search(email_pattern, line) or 
-                any(re.search(pattern, line) for pattern in phone_patterns)):
-                contact_line = line
-                break
+        contact_start = None
+        for match in (email_match, phone_match):
+            if match and (contact_start is None or match.start() < contact_start):
+                contact_start = match.start()
+        if contact_start is not None:
+            line_start = text.rfind('\n', 0, contact_start) + 1
+            line_end = text.find('\n', contact_start)
+            contact_line = text[line_start:line_end if line_end != -1 else len(text)]
         
         if contact_line:
             # Extract location (words that are not email, phone, or links)
-            words = re.split(r'[|,\s]+', contact_line)
-            location_words = []
-            for word in words:
-                word = word.strip()
-                if (word and 
-                    not re.match(email_pattern, word) and
-                    not any(re.match(pattern, word) for pattern in phone_patterns) and
-                    not re.match(r'https?://', word) and
-                    not re.match(r'www\.', word) and
-                    not re.match(r'github\.com|linkedin\.com', word, re.IGNORECASE) and
-                    len(word) > 2):
-                    location_words.append(word)
+            words = _CONTACT_SPLIT_RE.split(contact_line)
+            location_words = [
+                word for token in words
+                if len(word := token.strip()) > 2 and not _CONTACT_TOKEN_RE.match(word)
+            ]
             
             if location_words:
                 result["location"] = ", ".join(location_words)
 
         # Extract links
-        github_pattern = r'github\.com/[^\s]+'
-        linkedin_pattern = r'linkedin\.com/[^\s]+'
-        portfolio_pattern = r'https?://[^\s]*(?:portfolio|website|site)[^\s]*'
-        
-        github_matches = re.findall(github_pattern, text, re.IGNORECASE)
-        if github_matches:
-            result["links"]["github"] = github_matches[0]
+        github_match = _GITHUB_RE.search(text)
+        if github_match:
+            result["links"]["github"] = github_match.group()
         
-        linkedin_matches = re.findall(linkedin_pattern, text, re.IGNORECASE)
-        if linkedin_matches:
-            result["links"]["linkedin"] = linkedin_matches[0]
+        linkedin_match = _LINKEDIN_RE.search(text)
+        if linkedin_match:
+            result["links"]["linkedin"] = linkedin_match.group()
         
-        portfolio_matches = re.findall(portfolio_pattern, text, re.IGNORECASE)
-        if portfolio_matches:
-            result["links"]["portfolio"] = portfolio_matches[0]
+        portfolio_match = _PORTFOLIO_RE.search(text)
+        if portfolio_match:
+            result["links"]["portfolio"] = portfolio_match.group()
 
         # Extract sections using improved logic
-        sections = ResumeParserService._extract_sections_improved(text)
+        sections = ResumeParserService._extract_sections_improved(lines)
         
         # Extract work experience with detailed parsing
         if "experience" in sections:
@@ -304,23 +593,26 @@ class ResumeParserService:
         return result
 
     @staticmethod
-    def _extract_sections_improved(text: str) -> dict:
-        """Extract sections from text using improved logic."""
+    def _match_section(line_lower: str):
+        """
+        Return the section whose keyword appears in the lowercased line, or None.
+        When several sections match, the first one in _SECTION_KEYWORDS wins.
+        """
+        if not _SECTION_KEYWORDS_RE.search(line_lower):
+            return None
+        for section_name, keywords in _SECTION_KEYWORDS.items():
+            if any(keyword in line_lower for keyword in keywords):
+                return section_name
+        return None
+
+    @staticmethod
+    def _extract_sections_improved(lines: list) -> dict:
+        """Extract sections from the text's lines using improved logic."""
         sections = {}
-        lines = text.split('\n')
         
         current_section = None
         current_content = []
         
-        section_keywords = {
-            "experience": ["experience", "work experience", "employment", "professional experience"],
-            "education": ["education", "academic", "qualifications"],
-            "skills": ["skills", "technical skills", "competencies", "technologies"],
-            "interests": ["interests", "hobbies", "activities"],
-            "volunteer": ["volunteer", "volunteering", "community service"],
-            "additional_info": ["additional information", "additional info", "other information"]
-        }
-        
         for line in lines:
             line_clean = line.strip()
             
@@ -330,12 +622,7 @@ class ResumeParserService:
             
             # Check if this line starts a new section
             line_lower = line_clean.lower()
-            found_section = None
-            
-            for section_name, keywords in section_keywords.items():
-                if any(keyword in line_lower for keyword in keywords):
-                    found_section = section_name
-                    break
+            found_section = ResumeParserService._match_section(line_lower)
             
             if found_section:
                 # Save previous section
@@ -347,8 +634,7 @@ class ResumeParserService:
                 current_content = []
             elif current_section:
                 # Check if we've hit another section header (all caps words)
-                if (line_clean.isupper() and len(line_clean.split()) <= 3 and 
-                    any(keyword in line_clean.lower() for keywords in section_keywords.values() for keyword in keywords)):
+                if line_clean.isupper() and " ".join(line_lower.split()) in _ALL_SECTION_HEADERS:
                     # Save current section and start new one
                     if current_content:
                         sections[current_section] = current_content
@@ -367,39 +653,32 @@ class ResumeParserService:
     def _parse_experience_improved(experience_lines: list) -> list:
         """Parse work experience with improved logic."""
         experiences = []
-        current_exp = ""
+        current_exp_parts = []
         
         for line in experience_lines:
             if "|" in line:  # New experience entry
-                if current_exp:
-                    experiences.append(current_exp.strip())
-                current_exp = line
+                if current_exp_parts:
+                    experiences.append(" ".join(current_exp_parts).strip())
+                current_exp_parts = [line]
             else:
-                current_exp += " " + line
+                current_exp_parts.append(line)
         
-        if current_exp:
-            experiences.append(current_exp.strip())
+        if current_exp_parts:
+            experiences.append(" ".join(current_exp_parts).strip())
         
         return experiences
 
     @staticmethod
     def _parse_education_improved(education_lines: list) -> list:
         """Parse education with improved logic."""
-        education = []
-        for line in education_lines:
-            if line and not line.startswith('-'):
-                education.append(line)
-        
-        return education
+        return ResumeParserService._keep_nonbullet(education_lines)
 
     @staticmethod
     def _parse_skills_improved(skills_lines: list) -> list:
         """Parse skills with improved logic."""
-        skills_text = " ".join(skills_lines)
-        # Split by commas and clean up
-        skills = [skill.strip() for skill in re.split(r',|\s+', skills_text) 
-                 if skill.strip() and len(skill.strip()) > 1 and not skill.strip().startswith('-')]
-        return skills
+        # Split by commas/whitespace and clean up, stripping each token once
+        return [skill for token in _SKILL_SPLIT_RE.split(" ".join(skills_lines))
+                if len(skill := token.strip()) > 1 and not skill.startswith('-')]
 
     @staticmethod
     def _parse_interests_improved(interests_lines: list) -> list:
@@ -409,12 +688,12 @@ class ResumeParserService:
     @staticmethod
     def _parse_volunteer_improved(volunteer_lines: list) -> list:
         """Parse volunteer work with improved logic."""
-        volunteer = []
-        for line in volunteer_lines:
-            if line and not line.startswith('-'):
-                volunteer.append(line)
-        
-        return volunteer
+        return ResumeParserService._keep_nonbullet(volunteer_lines)
+
+    @staticmethod
+    def _keep_nonbullet(lines: list) -> list:
+        """Return the non-empty lines that are not '-' bullets or separators."""
+        return [line for line in lines if line and not line.startswith('-')]
 
     @staticmethod
     def _parse_additional_info(additional_lines: list) -> dict:
@@ -437,9 +716,10 @@ class ResumeParserService:
                     # Extract skills information
                     skills_text = line.replace("Skills:", "").strip()
                     if skills_text:
-                        skills = [skill.strip() for skill in re.split(r',|\s+', skills_text) 
-                                if skill.strip() and len(skill.strip()) > 1]
-                        additional_info["skills"].extend(skills)
+                        additional_info["skills"].extend(
+                            skill for token in _SKILL_SPLIT_RE.split(skills_text)
+                            if len(skill := token.strip()) > 1
+                        )
                 else:
                     # Consider other lines as interests or general info
                     additional_info["interests"].append(line)
@@ -458,11 +738,15 @@ class ResumeParserService:
             "end_date": None,
             "projects": ""
         }
+        # Description lines of the current entry, joined only when it is saved
+        desc_parts = []
         
         for line in experience_lines:
             if "|" in line:  # New experience entry
                 if current_exp["Company Name"]:  # Save previous experience
+                    current_exp["description"] = " ".join(desc_parts)
                     experiences.append(current_exp.copy())
+                    desc_parts.clear()
                 
                 # Parse new experience line
                 parts = [part.strip() for part in line.split("|")]
@@ -471,7 +755,7 @@ class ResumeParserService:
                 if len(parts) >= 2:
                     # Try to extract dates
                     date_part = parts[1]
-                    dates = re.findall(r'\d{2}/\d{4}|\d{4}', date_part)
+                    dates = _EXPERIENCE_DATE_RE.findall(date_part)
                     if len(dates) >= 1:
                         current_exp["start_date"] = dates[0]
                     if len(dates) >= 2:
@@ -484,11 +768,13 @@ class ResumeParserService:
                     current_exp["projects"] = parts[3]
             else:
                 # Add to description
-                if line.strip() and not line.strip().startswith('-'):
-                    current_exp["description"] += line.strip() + " "
+                line_clean = line.strip()
+                if line_clean and not line_clean.startswith('-'):
+                    desc_parts.append(line_clean)
         
         # Add last experience
         if current_exp["Company Name"]:
+            current_exp["description"] = " ".join(desc_parts)
             experiences.append(current_exp)
         
         return experiences
@@ -516,7 +802,7 @@ class ResumeParserService:
                 if len(parts) >= 3:
                     # Try to extract graduation date
                     date_part = parts[2]
-                    dates = re.findall(r'\d{4}', date_part)
+                    dates = _YEAR_RE.findall(date_part)
                     if dates:
                         education["graduate_date"] = dates[0]
                 